@@ -7,9 +7,29 @@ bilby_pipe is a python3 tool for automating the process of running `bilby
 estimation on computing clusters.
 
 """
+import sys
+from importlib import import_module
 
-from . import bilbyargparser, main, parser, utils
+if sys.version_info < (3, 7):
+    # Module-level __getattr__ (PEP 562) is not available, so import eagerly
+    from . import bilbyargparser, main, parser, utils
 
-__version__ = utils.get_version_information()
-__short_version__ = utils.get_version_information().split(":", 1)[0]
-__long_version__ = utils.get_version_information()
+    __version__ = utils.get_version_information()
+    __short_version__ = utils.get_version_information().split(":", 1)[0]
+    __long_version__ = utils.get_version_information()
+
+# The submodules pull in heavy dependencies (bilby, configargparse, pycondor),
+# so they are only imported on first access (PEP 562)
+_LAZY_SUBMODULES = ["bilbyargparser", "main", "parser", "utils"]
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return import_module(f".{name}", __name__)
+    elif name in ["__version__", "__short_version__", "__long_version__"]:
+        version = import_module(".utils", __name__).get_version_information()
+        globals()["__version__"] = version
+        globals()["__short_version__"] = version.split(":", 1)[0]
+        globals()["__long_version__"] = version
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,18 +2,36 @@
 argument parser for bilby_pipe, adapted from configargparse.ArgParser.
 """
 
+import io
 import os
 import re
 import sys
+from functools import lru_cache
 
 import configargparse
 
 from .utils import DuplicateErrorDict, get_version_information, logger
 
+# Patterns used to match the lines of a config file, compiled once at import
+_WHITE_SPACE = r"\s*"
+_KEY = r"(?P<key>[^:=;#\s]+?)"
+_VALUE = _WHITE_SPACE + r"[:=\s]" + _WHITE_SPACE + r"(?P<value>.+?)"
+_COMMENT = _WHITE_SPACE + r"(?P<comment>\s[;#].*)?"
+_KEY_ONLY_RE = re.compile("^" + _KEY + _COMMENT + "$")
+_KEY_VALUE_RE = re.compile("^" + _KEY + _VALUE + _COMMENT + "$")
+_SEPARATOR_RE = re.compile(r"[:=;#\s]")
+_COMMENT_FIRST_CHARS = frozenset("#;[")
+
+
+@lru_cache(maxsize=4096)
+def _hyphenate(content):
+    """ Replace underscores with hyphens, cached as the same keys recur often """
+    return content.replace("_", "-")
+
 
 class HyphenStr(str):
     def __new__(cls, content):
-        return super(HyphenStr, cls).__new__(cls, content.replace("_", "-"))
+        return super(HyphenStr, cls).__new__(cls, _hyphenate(content))
 
 
 class BilbyArgParser(configargparse.ArgParser):
@@ -89,7 +107,7 @@ class BilbyArgParser(configargparse.ArgParser):
         file_contents = None
         config_stream = self._open_config_files(args)
         if config_stream:
-            config_file_parser = BilbyConfigFileParser()
+            config_file_parser = _CONFIG_FILE_PARSER
             ini_stream = config_stream.pop()  # get ini file's steam
             ini_items, numbers, comments, inline_comments = config_file_parser.parse(
                 ini_stream
@@ -98,10 +116,8 @@ class BilbyArgParser(configargparse.ArgParser):
             self.numbers = numbers
             self.comments = comments
             self.inline_comments = inline_comments
-            corrected_items = dict(
-                (key.replace("_", "-"), val) for key, val in ini_items.items()
-            )
-            file_contents = config_file_parser.serialize(corrected_items)
+            # The parser already stores every key as a HyphenStr
+            file_contents = config_file_parser.serialize(ini_items)
 
         return file_contents
 
@@ -136,8 +152,10 @@ class BilbyArgParser(configargparse.ArgParser):
                 normalized_args.append(key)
                 normalized_args.append(value)
             else:
-                if arg.startswith("--"):
-                    arg.replace("_", "-")
+                # Values containing spaces are never option names, e.g.
+                # --postprocessing-arguments "--some_flag 1", so leave them be
+                if arg.startswith("--") and "_" in arg and " " not in arg:
+                    arg = HyphenStr(arg)
                 normalized_args.append(arg)
 
         return normalized_args
@@ -153,41 +171,45 @@ class BilbyArgParser(configargparse.ArgParser):
     ):
         if os.path.isfile(filename) and not overwrite:
             logger.warning(f"File {filename} already exists, not writing to file.")
-        with open(filename, "w") as ff:
-            __version__ = get_version_information()
+        # Format the whole file in memory and write it in one go, rather than
+        # issuing a separate write for each of the several hundred lines
+        ff = io.StringIO()
+        __version__ = get_version_information()
+        if include_description:
+            print(
+                f"## This file was written with bilby_pipe version {__version__}\n",
+                file=ff,
+            )
+        if isinstance(comment, str):
+            print("#" + comment + "\n", file=ff)
+        for group in self._action_groups[2:]:
+            print("#" * 80, file=ff)
+            print(f"## {group.title}", file=ff)
             if include_description:
-                print(
-                    f"## This file was written with bilby_pipe version {__version__}\n",
-                    file=ff,
-                )
-            if isinstance(comment, str):
-                print("#" + comment + "\n", file=ff)
-            for group in self._action_groups[2:]:
-                print("#" * 80, file=ff)
-                print(f"## {group.title}", file=ff)
+                print(f"# {group.description}", file=ff)
+            print("#" * 80 + "\n", file=ff)
+            for action in group._group_actions:
                 if include_description:
-                    print(f"# {group.description}", file=ff)
-                print("#" * 80 + "\n", file=ff)
-                for action in group._group_actions:
-                    if include_description:
-                        print(f"# {action.help}", file=ff)
-                    dest = action.dest
-                    hyphen_dest = HyphenStr(dest)
-                    if isinstance(args, dict):
-                        if action.dest in args:
-                            value = args[dest]
-                        elif hyphen_dest in args:
-                            value = args[hyphen_dest]
-                        else:
-                            value = action.default
+                    print(f"# {action.help}", file=ff)
+                dest = action.dest
+                hyphen_dest = HyphenStr(dest)
+                if isinstance(args, dict):
+                    if action.dest in args:
+                        value = args[dest]
+                    elif hyphen_dest in args:
+                        value = args[hyphen_dest]
                     else:
-                        value = getattr(args, dest, action.default)
+                        value = action.default
+                else:
+                    value = getattr(args, dest, action.default)
 
-                    if exclude_default and value == action.default:
-                        continue
-                    self.write_comment_if_needed(hyphen_dest, ff)
-                    self.write_line(hyphen_dest, value, ff)
-                print("", file=ff)
+                if exclude_default and value == action.default:
+                    continue
+                self.write_comment_if_needed(hyphen_dest, ff)
+                self.write_line(hyphen_dest, value, ff)
+            print("", file=ff)
+        with open(filename, "w") as file:
+            file.write(ff.getvalue())
 
     def write_comment_if_needed(self, hyphen_dest, ff):
         """ Determine if the line is associated with a comment """
@@ -202,11 +224,12 @@ class BilbyArgParser(configargparse.ArgParser):
                     break
 
     def write_line(self, hyphen_dest, value, ff):
-        if hyphen_dest in self.numbers:
-            comment = self.inline_comments.get(self.numbers[hyphen_dest], "")
+        number = self.numbers.get(hyphen_dest)
+        if number is not None:
+            comment = self.inline_comments.get(number, "")
+            ff.write(f"{hyphen_dest}={value}{comment}\n")
         else:
-            comment = ""
-        print(f"{hyphen_dest}={value}{comment}", file=ff)
+            ff.write(f"{hyphen_dest}={value}\n")
 
 
 class BilbyConfigFileParser(configargparse.DefaultConfigFileParser):
@@ -253,40 +276,43 @@ class BilbyConfigFileParser(configargparse.DefaultConfigFileParser):
             line = line.strip()
             if not line:
                 continue
-            if line[0] in ["#", ";", "["] or line.startswith("---"):
+            if line[0] in _COMMENT_FIRST_CHARS or line.startswith("---"):
                 comments[ii] = line
                 continue
-            if len(line.split("#")) > 1:
-                inline_comments[ii] = "  #" + "#".join(line.split("#")[1:])
-                line = line.split("#")[0]
-            white_space = "\\s*"
-            key = r"(?P<key>[^:=;#\s]+?)"
-            value = white_space + r"[:=\s]" + white_space + "(?P<value>.+?)"
-            comment = white_space + "(?P<comment>\\s[;#].*)?"
-
-            key_only_match = re.match("^" + key + comment + "$", line)
-            if key_only_match:
-                key = HyphenStr(key_only_match.group("key"))
-                items[key] = "true"
-                numbers[key] = ii
-                continue
-
-            key_value_match = re.match("^" + key + value + comment + "$", line)
-            if key_value_match:
-                key = HyphenStr(key_value_match.group("key"))
+            if "#" in line:
+                line, _, inline_comment = line.partition("#")
+                inline_comments[ii] = "  #" + inline_comment
+            # Fast path for plain key=value or key: value lines, only falling
+            # back to the regular expressions for anything less simple
+            key, sep, value = line.partition("=")
+            if not sep:
+                key, sep, value = line.partition(":")
+            key = key.strip()
+            value = value.strip()
+            if not (sep and key and value) or ";" in line or _SEPARATOR_RE.search(key):
+                key_only_match = _KEY_ONLY_RE.match(line)
+                if key_only_match:
+                    key = HyphenStr(key_only_match.group("key"))
+                    items[key] = "true"
+                    numbers[key] = ii
+                    continue
+
+                key_value_match = _KEY_VALUE_RE.match(line)
+                if not key_value_match:
+                    raise configargparse.ConfigFileParserException(
+                        f"Unexpected line {ii} in "
+                        f"{getattr(stream, 'name', 'stream')}: {line}"
+                    )
+                key = key_value_match.group("key")
                 value = key_value_match.group("value")
 
-                if value.startswith("[") and value.endswith("]"):
-                    # handle special case of lists
-                    value = [elem.strip() for elem in value[1:-1].split(",")]
-
-                items[key] = value
-                numbers[key] = ii
-                continue
+            key = HyphenStr(key)
+            if value.startswith("[") and value.endswith("]"):
+                # handle special case of lists
+                value = [elem.strip() for elem in value[1:-1].split(",")]
 
-            raise configargparse.ConfigFileParserException(
-                f"Unexpected line {ii} in {getattr(stream, 'name', 'stream')}: {line}"
-            )
+            items[key] = value
+            numbers[key] = ii
 
         items = self.reconstruct_multiline_dictionary(items)
         return items, numbers, comments, inline_comments
@@ -324,3 +350,7 @@ class BilbyConfigFileParser(configargparse.DefaultConfigFileParser):
                     "{"
                 )
         return items
+
+
+# The config file parser holds no state between parses, so share one instance
+_CONFIG_FILE_PARSER = BilbyConfigFileParser()
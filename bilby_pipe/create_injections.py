@@ -26,7 +26,6 @@ from .input import Input
 from .utils import (
     BilbyPipeError,
     check_directory_exists_and_if_not_mkdir,
-    get_geocent_time_with_uncertainty,
     logger,
     parse_args,
 )
@@ -204,16 +203,17 @@ class InjectionCreator(Input):
         """Samples parameters from the prior into a dataframe"""
         inj_df = pd.DataFrame.from_dict(self.priors.sample(self.n_injection))
         if self.gps_file is not None:
-            geocent_times = []
-            for start_time in self.gpstimes:
-                geocent_time = get_geocent_time_with_uncertainty(
-                    geocent_time=start_time
-                    + self.duration
-                    - self.post_trigger_duration,
-                    uncertainty=self.deltaT / 2.0,
-                )
-                geocent_times.append(geocent_time)
-            inj_df["geocent_time"] = geocent_times
+            # Draw all the offsets at once rather than a prior per start time
+            uncertainty = self.deltaT / 2.0
+            offsets = bilby.core.prior.Uniform(-uncertainty, uncertainty).sample(
+                len(self.gpstimes)
+            )
+            inj_df["geocent_time"] = (
+                np.asarray(self.gpstimes)
+                + self.duration
+                - self.post_trigger_duration
+                + offsets
+            )
         return inj_df
 
     @staticmethod
@@ -222,12 +222,26 @@ class InjectionCreator(Input):
         path, extension = get_full_path(filename, extension)
         if extension == "json":
             injections = dict(injections=dataframe)
+            # json.dumps without indentation runs in the C encoder, whereas
+            # json.dump always falls back to the pure-python one
             with open(path, "w") as file:
-                json.dump(
-                    injections, file, indent=2, cls=bilby.core.result.BilbyJsonEncoder
+                file.write(
+                    json.dumps(injections, cls=bilby.core.result.BilbyJsonEncoder)
                 )
         elif extension == "dat":
-            dataframe.to_csv(path, index=False, header=True, sep=" ")
+            values = dataframe.to_numpy()
+            if all(dtype == np.float64 for dtype in dataframe.dtypes) and np.all(
+                np.isfinite(values)
+            ):
+                # Format the floats directly rather than through the slower
+                # pandas csv writer, the output is identical for this case
+                with open(path, "w") as file:
+                    file.write(" ".join(dataframe.columns) + "\n")
+                    file.writelines(
+                        " ".join(map(repr, row)) + "\n" for row in values.tolist()
+                    )
+            else:
+                dataframe.to_csv(path, index=False, header=True, sep=" ")
         else:
             raise BilbyPipeCreateInjectionsError(
                 f"Extension {extension} not implemented"
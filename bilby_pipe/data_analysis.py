@@ -18,11 +18,6 @@ from bilby_pipe.utils import (
     logger,
 )
 
-# fmt: off
-import matplotlib  # isort:skip
-matplotlib.use("agg")
-# fmt: on
-
 
 def sighandler(signum, frame):
     logger.info("Performing periodic eviction")
@@ -225,6 +220,12 @@ class DataAnalysisInput(Input):
         return likelihood, priors
 
     def run_sampler(self):
+        # Only the sampler's plots need matplotlib, so the backend is selected
+        # here rather than paying for the import whenever the module is loaded
+        import matplotlib
+
+        matplotlib.use("agg")
+
         if self.scheduler.lower() == "condor":
             signal.signal(signal.SIGALRM, handler=sighandler)
             signal.alarm(self.periodic_restart_time)
@@ -25,12 +25,6 @@ from bilby_pipe.utils import (
     logger,
 )
 
-# fmt: off
-import matplotlib  # isort:skip
-matplotlib.use("agg")
-# fmt: on
-
-
 try:
     import nds2  # noqa
 except ImportError:
@@ -1095,6 +1089,14 @@ class DataGenerationInput(Input):
             )
         else:
             likelihood_lookup_table = None
+        # Only the ROQ weights are read back by the analysis: other likelihoods,
+        # e.g. the multibanded one, also store (large) weights
+        if "roq" in self.likelihood_type.lower():
+            likelihood_roq_weights = getattr(likelihood, "weights", None)
+            likelihood_roq_params = getattr(likelihood, "roq_params", None)
+        else:
+            likelihood_roq_weights = None
+            likelihood_roq_params = None
         data_dump = DataDump(
             outdir=self.data_directory,
             label=self.label,
@@ -1103,8 +1105,8 @@ class DataGenerationInput(Input):
             interferometers=self.interferometers,
             meta_data=self.meta_data,
             likelihood_lookup_table=likelihood_lookup_table,
-            likelihood_roq_weights=getattr(likelihood, "weights", None),
-            likelihood_roq_params=getattr(likelihood, "roq_params", None),
+            likelihood_roq_weights=likelihood_roq_weights,
+            likelihood_roq_params=likelihood_roq_params,
             priors_dict=dict(self.priors),
             priors_class=self.priors.__class__,
         )
@@ -4,6 +4,7 @@ The functionality of much of these utility assumes the user is running on the
 CIT cluster, e.g. the ROQ and calibration directories are in there usual place
 """
 import argparse
+import bisect
 import json
 import os
 import shutil
@@ -39,6 +40,29 @@ CHANNEL_DICTS = dict(
 CBC_PIPELINES = ["gstlal", "pycbc", "mbtaonline", "spiir"]
 BURST_PIPELINES = ["cwb"]
 
+CALENVS_BASE = "/home/cbc/pe/O3/calibrationenvelopes"
+CALENVS_LOOKUP = dict(
+    H1=os.path.join(CALENVS_BASE, "LIGO_Hanford/H_CalEnvs.txt"),
+    L1=os.path.join(CALENVS_BASE, "LIGO_Livingston/L_CalEnvs.txt"),
+    V1=os.path.join(CALENVS_BASE, "Virgo/V_CalEnvs.txt"),
+)
+
+# Lower chirp-mass bounds (exclusive) and the (duration, roq_scale_factor)
+# used for a chirp mass within each interval
+CHIRP_MASS_THRESHOLDS = [0.9, 1.43, 2.39, 3.68, 5.66, 8.73, 13.53, 35, 90]
+DURATION_AND_ROQ_SCALE_FACTORS = [
+    (128, 1 / 2),
+    (128, 1 / 1.6),
+    (128, 1),
+    (64, 1),
+    (32, 1),
+    (16, 1),
+    (8, 1),
+    (4, 1),
+    (4, 2),
+    (4, 4),
+]
+
 
 def x509userproxy(outdir):
     """Copies X509_USER_PROXY certificate from user's os.environ and
@@ -157,15 +181,8 @@ def calibration_lookup(trigger_time, detector):
         file can be determined, None is returned.
 
     """
-    base = "/home/cbc/pe/O3/calibrationenvelopes"
-    CALENVS_LOOKUP = dict(
-        H1=os.path.join(base, "LIGO_Hanford/H_CalEnvs.txt"),
-        L1=os.path.join(base, "LIGO_Livingston/L_CalEnvs.txt"),
-        V1=os.path.join(base, "Virgo/V_CalEnvs.txt"),
-    )
-
-    if os.path.isdir(base) is False:
-        raise BilbyPipeError(f"Unable to read from calibration folder {base}")
+    if os.path.isdir(CALENVS_BASE) is False:
+        raise BilbyPipeError(f"Unable to read from calibration folder {CALENVS_BASE}")
 
     calenv = CALENVS_LOOKUP[detector]
     times = list()
@@ -486,32 +503,8 @@ def determine_duration_and_scale_factor_from_parameters(chirp_mass):
     duration: int
     roq_scale_factor: float
     """
-    roq_scale_factor = 1
-    if chirp_mass > 90:
-        duration = 4
-        roq_scale_factor = 4
-    elif chirp_mass > 35:
-        duration = 4
-        roq_scale_factor = 2
-    elif chirp_mass > 13.53:
-        duration = 4
-    elif chirp_mass > 8.73:
-        duration = 8
-    elif chirp_mass > 5.66:
-        duration = 16
-    elif chirp_mass > 3.68:
-        duration = 32
-    elif chirp_mass > 2.39:
-        duration = 64
-    elif chirp_mass > 1.43:
-        duration = 128
-    elif chirp_mass > 0.9:
-        duration = 128
-        roq_scale_factor = 1 / 1.6
-    else:
-        duration = 128
-        roq_scale_factor = 1 / 2
-
+    idx = bisect.bisect_left(CHIRP_MASS_THRESHOLDS, chirp_mass)
+    duration, roq_scale_factor = DURATION_AND_ROQ_SCALE_FACTORS[idx]
     return duration, round(1 / roq_scale_factor, 1)
 
 
@@ -297,10 +297,10 @@ class Input(object):
 
         This can be a function defined in an external package.
         """
-        if self.frequency_domain_source_model in bilby.gw.source.__dict__.keys():
-            model = self._frequency_domain_source_model
-            logger.info(f"Using the {model} source model")
-            return bilby.gw.source.__dict__[model]
+        model = getattr(bilby.gw.source, self._frequency_domain_source_model, None)
+        if model is not None:
+            logger.info(f"Using the {self._frequency_domain_source_model} source model")
+            return model
         elif "." in self.frequency_domain_source_model:
             return get_function_from_string_path(self._frequency_domain_source_model)
         else:
@@ -392,6 +392,24 @@ class Input(object):
         else:
             raise BilbyPipeError("Unable to determine roq_source from source model")
 
+    @property
+    def bilby_multiband_frequency_domain_source_model(self):
+        if not hasattr(bilby.gw.source, "binary_black_hole_frequency_sequence"):
+            raise BilbyPipeError(
+                "The multibanded likelihood requires bilby>=1.1.4, "
+                f"found bilby={bilby.__version__}"
+            )
+        elif "binary_neutron_star" in self.frequency_domain_source_model:
+            logger.info("Using the binary_neutron_star_frequency_sequence source model")
+            return bilby.gw.source.binary_neutron_star_frequency_sequence
+        elif "binary_black_hole" in self.frequency_domain_source_model:
+            logger.info("Using the binary_black_hole_frequency_sequence source model")
+            return bilby.gw.source.binary_black_hole_frequency_sequence
+        else:
+            raise BilbyPipeError(
+                "Unable to determine multiband source from source model"
+            )
+
     @property
     def frequency_domain_source_model(self):
         """ String of which frequency domain source model to use """
@@ -883,8 +901,10 @@ class Input(object):
         prior: bilby.core.prior.PriorDict
             The generated prior
         """
-        if self.default_prior in self.combined_default_prior_dicts.keys():
-            prior_class = self.combined_default_prior_dicts[self.default_prior]
+        # Copying the module namespaces is not free, so only do it once
+        prior_dicts = self.combined_default_prior_dicts
+        if self.default_prior in prior_dicts:
+            prior_class = prior_dicts[self.default_prior]
             if self.prior_dict is not None:
                 priors = prior_class(dictionary=self.prior_dict)
             else:
@@ -1063,6 +1083,36 @@ class Input(object):
             likelihood_kwargs.pop("time_marginalization", None)
             likelihood_kwargs.pop("jitter_time", None)
             likelihood_kwargs.update(self.roq_likelihood_kwargs)
+        elif self.likelihood_type == "MBGravitationalWaveTransient":
+            Likelihood = bilby.gw.likelihood.MBGravitationalWaveTransient
+            likelihood_kwargs.update(jitter_time=self.jitter_time)
+            likelihood_kwargs.update(self.extra_likelihood_kwargs)
+
+            if "reference_chirp_mass" not in likelihood_kwargs:
+                if "chirp_mass" not in self.priors:
+                    raise BilbyPipeError(
+                        "No chirp_mass prior to set the reference_chirp_mass for "
+                        "the multibanded likelihood: give it in the "
+                        "extra-likelihood-kwargs"
+                    )
+                reference_chirp_mass = self.priors["chirp_mass"].minimum
+                logger.info(
+                    f"Setting reference_chirp_mass={reference_chirp_mass} from the "
+                    "chirp_mass prior minimum"
+                )
+                likelihood_kwargs["reference_chirp_mass"] = reference_chirp_mass
+
+            likelihood_args = inspect.getfullargspec(Likelihood.__init__).args
+            for key in [
+                "distance_marginalization",
+                "phase_marginalization",
+                "time_marginalization",
+            ]:
+                if likelihood_kwargs[key] and key not in likelihood_args:
+                    logger.warning(
+                        f"{key} not implemented for MBGravitationalWaveTransient "
+                        f"in bilby={bilby.__version__}: option ignored"
+                    )
         elif "." in self.likelihood_type:
             split_path = self.likelihood_type.split(".")
             module = ".".join(split_path[:-1])
@@ -1197,6 +1247,17 @@ class Input(object):
                 waveform_arguments=waveform_arguments,
             )
 
+        elif self.likelihood_type == "MBGravitationalWaveTransient":
+            logger.info(f"Using {self.likelihood_type} likelihood")
+            waveform_generator = self.waveform_generator_class(
+                frequency_domain_source_model=self.bilby_multiband_frequency_domain_source_model,
+                sampling_frequency=self.interferometers.sampling_frequency,
+                duration=self.interferometers.duration,
+                parameter_conversion=self.parameter_conversion,
+                start_time=self.interferometers.start_time,
+                waveform_arguments=waveform_arguments,
+            )
+
         else:
             waveform_generator = self.waveform_generator_class(
                 frequency_domain_source_model=self.bilby_frequency_domain_source_model,
@@ -1296,9 +1357,10 @@ class Input(object):
     def sampler_kwargs(self, sampler_kwargs):
         if sampler_kwargs is not None:
             if sampler_kwargs.lower() == "default":
-                self._sampler_kwargs = SAMPLER_SETTINGS["Default"]
+                # Copy the presets so later updates (e.g. npool) do not leak
+                self._sampler_kwargs = SAMPLER_SETTINGS["Default"].copy()
             elif sampler_kwargs.lower() == "fasttest":
-                self._sampler_kwargs = SAMPLER_SETTINGS["FastTest"]
+                self._sampler_kwargs = SAMPLER_SETTINGS["FastTest"].copy()
             else:
                 self._sampler_kwargs = convert_string_to_dict(
                     sampler_kwargs, "sampler-kwargs"
@@ -1,8 +1,6 @@
 import os
 import sys
 
-import pycondor
-
 from ..utils import logger
 from . import slurm
 
@@ -21,11 +19,16 @@ class Dag(object):
         self.scheduler_env = self.inputs.scheduler_env
         self.scheduler_analysis_time = self.inputs.scheduler_analysis_time
 
+        # Executable paths resolved by the nodes while building this DAG
+        self.executable_paths = dict()
+
         # The slurm setup uses the pycondor dag as a base
         if self.scheduler.lower() in ["condor", "slurm"]:
             self.setup_pycondor_dag()
 
     def setup_pycondor_dag(self):
+        import pycondor
+
         self.pycondor_dag = pycondor.Dagman(
             name=self.dag_name, submit=self.submit_directory
         )
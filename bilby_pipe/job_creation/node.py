@@ -4,8 +4,6 @@ import shutil
 import subprocess
 from pathlib import Path
 
-import pycondor
-
 from ..utils import CHECKPOINT_EXIT_CODE, ArgumentsString, BilbyPipeError, logger
 
 
@@ -44,13 +42,18 @@ class Node(object):
             )
             subprocess.run([self.executable] + self.arguments.argument_list, check=True)
 
-    @staticmethod
-    def _get_executable_path(exe_name):
-        exe = shutil.which(exe_name)
-        if exe is not None:
-            return exe
-        else:
-            raise OSError(f"{exe_name} not installed on this system, unable to proceed")
+    def _get_executable_path(self, exe_name):
+        # Every node of the DAG resolves the same few executables, so the paths
+        # are cached on the DAG being built
+        executable_paths = self.dag.executable_paths
+        if exe_name not in executable_paths:
+            exe = shutil.which(exe_name)
+            if exe is None:
+                raise OSError(
+                    f"{exe_name} not installed on this system, unable to proceed"
+                )
+            executable_paths[exe_name] = exe
+        return executable_paths[exe_name]
 
     def setup_arguments(
         self,
@@ -75,6 +78,8 @@ class Node(object):
         raise NotImplementedError()
 
     def create_pycondor_job(self):
+        import pycondor
+
         job_name = self.job_name
         self.extra_lines.extend(
             _log_output_error_submit_lines(self.log_directory, job_name)
@@ -4,6 +4,7 @@ Module containing the tools for outputting slurm submission scripts
 """
 
 import os
+import shlex
 import subprocess
 
 from ..utils import logger
@@ -26,8 +27,8 @@ class SubmitSLURM(object):
         for node in self.dag.nodes:
             if "_generation" in node.name:
                 # Run the job locally
-                cmd = " ".join([node.executable, node.args[0].arg])
-                subprocess.run(cmd, shell=True)
+                cmd = [node.executable] + shlex.split(node.args[0].arg)
+                subprocess.run(cmd)
                 # Remove the children
                 for other_node in self.dag.nodes:
                     if node in other_node.parents:
@@ -82,16 +83,13 @@ class SubmitSLURM(object):
 
             for node, indx in zip(self.dag.nodes, jids):
                 # Generate the real slurm arguments from the dag node and the parsed slurm args
-                job_slurm_args = slurm_args
-                job_slurm_args += " --nodes=1"
-                job_slurm_args += f" --ntasks-per-node={node.request_cpus}"
-                job_slurm_args += " --mem={}G".format(
-                    int(float(node.request_memory.split(" ")[0]))
-                )
-                job_slurm_args += f" --time={node.slurm_walltime}"
-                job_slurm_args += f" --job-name={node.name}"
-
-                submit_str = f"\njid{indx}=($(sbatch {job_slurm_args} "
+                job_slurm_args = slurm_args.split() + [
+                    "--nodes=1",
+                    f"--ntasks-per-node={node.request_cpus}",
+                    "--mem={}G".format(int(float(node.request_memory.split(" ")[0]))),
+                    f"--time={node.slurm_walltime}",
+                    f"--job-name={node.name}",
+                ]
 
                 # get list of all parents associated with job
                 parents = [job.name for job in node.parents]
@@ -99,22 +97,23 @@ class SubmitSLURM(object):
                 if len(parents) > 0:
                     # only run subsequent jobs after parent has
                     # *successfully* completed
-                    submit_str += "--dependency=afterok"
+                    dependencies = "".join(
+                        [f":${{jid{job_dict[parent]}[-1]}}" for parent in parents]
+                    )
+                    job_slurm_args.append(f"--dependency=afterok{dependencies}")
 
-                    for parent in parents:
-                        submit_str += f":${{jid{job_dict[parent]}[-1]}}"
                 # get output file path from dag and use for slurm
                 output_file = self._output_name_from_dag(node.extra_lines)
 
-                submit_str += f" --output={output_file}"
-                submit_str += f" --error={output_file.replace('.out', '.err')}"
+                job_slurm_args.append(f"--output={output_file}")
+                job_slurm_args.append(f"--error={output_file.replace('.out', '.err')}")
 
                 job_script = self._write_individual_processes(
                     node.name, node.executable, node.args[0].arg
                 )
 
-                submit_str += f" {job_script}))\n\n"
-                submit_str += (
+                submit_str = (
+                    f"\njid{indx}=($(sbatch {' '.join(job_slurm_args)} {job_script}))\n\n"
                     f'echo "jid{indx} ${{jid{indx}[-1]}}" >> {self.slurm_id_file}'
                 )
 
@@ -124,7 +123,7 @@ class SubmitSLURM(object):
         command_line = f"sbatch {self.slurm_master_bash}"
 
         if self.submit:
-            subprocess.run([command_line], shell=True)
+            subprocess.run(["sbatch", self.slurm_master_bash])
         else:
             logger.info(f"slurm scripts written, to run jobs submit:\n$ {command_line}")
 
@@ -7,7 +7,6 @@ import configargparse
 import bilby
 from bilby_pipe.bilbyargparser import BilbyArgParser
 
-from .main import __doc__ as usage
 from .utils import get_version_information, logger, nonefloat, noneint, nonestr
 
 __version__ = get_version_information()
@@ -46,6 +45,7 @@ def create_parser(top_level=True):
         Argument parser
 
     """
+    from .main import __doc__ as usage
 
     parser = BilbyArgParser(
         usage=usage,
@@ -625,12 +625,14 @@ def create_parser(top_level=True):
         default="GravitationalWaveTransient",
         help=(
             "The likelihood. Can be one of [GravitationalWaveTransient, "
-            "ROQGravitationalWaveTransient, zero] or python path to a bilby "
-            "likelihood class available in the users installation. "
-            "The --roq-folder is required if the ROQ likelihood used."
-            "The --roq-folder is required if the ROQ likelihood used."
-            "If `zero` is given, a testing ZeroLikelihood is used which always"
-            "return zero."
+            "ROQGravitationalWaveTransient, MBGravitationalWaveTransient, zero] "
+            "or python path to a bilby likelihood class available in the users "
+            "installation. The --roq-folder is required if the ROQ likelihood is "
+            "used. The MBGravitationalWaveTransient likelihood requires "
+            "bilby>=1.1.4, its reference_chirp_mass can be given in the "
+            "--extra-likelihood-kwargs and otherwise defaults to the chirp_mass "
+            "prior minimum. If `zero` is given, a testing ZeroLikelihood is used "
+            "which always returns zero."
         ),
     )
     likelihood_parser.add(
@@ -10,7 +10,7 @@ import pickle
 import re
 import subprocess
 import sys
-import urllib
+import urllib.error
 import urllib.request
 from importlib import import_module
 from pathlib import Path
@@ -115,8 +115,10 @@ class DataDump(object):
         return self.get_filename(self.outdir, self.label)
 
     def to_pickle(self):
+        # Protocol 4 is faster than protocol 3 (the python<3.8 default) for the
+        # large strain arrays, unlike protocol 5 it is readable by python<3.8
         with open(self.filename, "wb+") as file:
-            pickle.dump(self, file)
+            pickle.dump(self, file, protocol=4)
 
     @classmethod
     def from_pickle(cls, filename=None):
@@ -283,7 +285,9 @@ def check_directory_exists_and_if_not_mkdir(directory):
 
     """
     if not os.path.exists(directory):
-        os.makedirs(directory)
+        # exist_ok guards against a concurrent job creating the directory
+        # between the check and the makedirs call
+        os.makedirs(directory, exist_ok=True)
         logger.debug(f"Making directory {directory}")
     else:
         logger.debug(f"Directory {directory} exists")
@@ -665,20 +669,9 @@ def convert_detectors_input(string):
         string = ",".join(string)
     if isinstance(string, str) is False:
         raise BilbyPipeError(f"Detector input {string} not understood")
-    # Remove square brackets
-    string = string.replace("[", "").replace("]", "")
-    # Remove added quotes
-    string = strip_quotes(string)
-    # Replace multiple spaces with a single space
-    string = " ".join(string.split())
-    # Spaces can be either space or comma in input, convert to comma
-    string = string.replace(" ,", ",").replace(", ", ",").replace(" ", ",")
-
-    detectors = string.split(",")
-
-    detectors.sort()
-    detectors = [det.upper() for det in detectors]
-    return detectors
+    # Square brackets and quotes are dropped, spaces and commas separate
+    detectors = sanitize_string_for_list(string)
+    return sorted(det.upper() for det in detectors)
 
 
 def convert_prior_string_input(string):
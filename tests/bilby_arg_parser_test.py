@@ -28,6 +28,13 @@ class TestBilbyArgParser(unittest.TestCase):
         self.assertTrue("param" in unknown_args)
         self.assertTrue("--sample-kwargs" in unknown_args)
 
+    def test_normalising_separate_args(self):
+        args_list = ["--sample_kwargs", "{'a':1}"]
+        bbargparser = BilbyArgParser()
+        args, unknown_args = bbargparser.parse_known_args(args_list)
+        self.assertTrue("--sample-kwargs" in unknown_args)
+        self.assertFalse("--sample_kwargs" in unknown_args)
+
     def test_args_string(self):
         bbargparser = BilbyArgParser()
         arg_key = "--key"
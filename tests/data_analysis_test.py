@@ -2,6 +2,8 @@ import os
 import shutil
 import unittest
 
+import mock
+
 import bilby
 from bilby_pipe.data_analysis import DataAnalysisInput, create_analysis_parser
 from bilby_pipe.main import parse_args
@@ -95,6 +97,71 @@ class TestDataAnalysisInput(unittest.TestCase):
         with self.assertRaises(BilbyPipeError):
             print(self.inputs.bilby_frequency_domain_source_model)
 
+    def set_up_multiband_likelihood_inputs(self):
+        ifos = bilby.gw.detector.InterferometerList(["H1", "L1"])
+        ifos.set_strain_data_from_zero_noise(
+            sampling_frequency=1024, duration=8, start_time=0
+        )
+        self.inputs._interferometers = ifos
+        priors = bilby.gw.prior.BBHPriorDict()
+        priors["geocent_time"] = bilby.core.prior.Uniform(5.9, 6.1)
+        self.inputs.priors = priors
+        self.inputs.distance_marginalization = False
+        self.inputs.time_marginalization = False
+        self.inputs.waveform_approximant = "IMRPhenomD"
+        self.inputs.minimum_frequency = 20
+        self.inputs.maximum_frequency = 512
+        self.inputs.likelihood_type = "MBGravitationalWaveTransient"
+
+    def test_multiband_likelihood(self):
+        self.set_up_multiband_likelihood_inputs()
+        self.inputs.extra_likelihood_kwargs = "{reference_chirp_mass: 20}"
+        likelihood = self.inputs.likelihood
+        self.assertIsInstance(
+            likelihood, bilby.gw.likelihood.MBGravitationalWaveTransient
+        )
+        self.assertEqual(likelihood.reference_chirp_mass, 20)
+        self.assertEqual(
+            likelihood.waveform_generator.frequency_domain_source_model,
+            bilby.gw.source.binary_black_hole_frequency_sequence,
+        )
+
+    def test_multiband_likelihood_default_reference_chirp_mass(self):
+        self.set_up_multiband_likelihood_inputs()
+        self.inputs.extra_likelihood_kwargs = None
+        likelihood = self.inputs.likelihood
+        self.assertEqual(
+            likelihood.reference_chirp_mass, self.inputs.priors["chirp_mass"].minimum
+        )
+
+    def test_multiband_likelihood_unsupported_marginalization(self):
+        class MBWithoutTimeMarginalization(
+            bilby.gw.likelihood.MBGravitationalWaveTransient
+        ):
+            def __init__(self, interferometers, waveform_generator, priors=None):
+                super().__init__(
+                    interferometers=interferometers,
+                    waveform_generator=waveform_generator,
+                    priors=priors,
+                )
+
+        self.set_up_multiband_likelihood_inputs()
+        self.inputs.time_marginalization = True
+        self.inputs.extra_likelihood_kwargs = None
+        with mock.patch(
+            "bilby.gw.likelihood.MBGravitationalWaveTransient",
+            MBWithoutTimeMarginalization,
+        ), self.assertLogs("bilby_pipe", level="WARNING") as logs:
+            self.inputs.likelihood
+        self.assertIn("time_marginalization not implemented", logs.output[0])
+
+    def test_multiband_likelihood_no_reference_chirp_mass(self):
+        self.set_up_multiband_likelihood_inputs()
+        self.inputs.priors.pop("chirp_mass")
+        self.inputs.extra_likelihood_kwargs = None
+        with self.assertRaises(BilbyPipeError):
+            self.inputs.likelihood
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,6 +4,7 @@ import unittest
 
 import gwpy
 import mock
+import numpy as np
 
 import bilby
 from bilby_pipe.data_generation import DataGenerationInput, create_generation_parser
@@ -271,6 +272,64 @@ class TestDataGenerationInput(unittest.TestCase):
         self.inputs = DataGenerationInput(*parse_args(args_list, self.parser))
         self.assertTrue(1 <= self.inputs.generation_seed <= 1e6)
 
+    @mock.patch("bilby_pipe.data_generation.DataGenerationInput._get_data")
+    def test_set_interferometers_from_data(self, get_data_method):
+        def get_data(det, channel_type, start_time, end_time):
+            return gwpy.timeseries.TimeSeries(
+                np.random.normal(
+                    0, 1e-21, int((end_time - start_time) * sampling_frequency)
+                ),
+                t0=start_time,
+                sample_rate=sampling_frequency,
+            )
+
+        sampling_frequency = self.inputs.sampling_frequency
+        get_data_method.side_effect = get_data
+        self.inputs.trigger_time = 0
+        self.inputs.injection = False
+        self.inputs.psd_dict = "{H1: tests/DATA/psd.txt}"
+        self.inputs._set_interferometers_from_data()
+
+        t0 = self.inputs.start_time
+        t1 = t0 + self.inputs.duration
+        t0_psd = t0 + self.inputs.psd_start_time
+        t1_psd = t0_psd + self.inputs.psd_duration
+
+        # The detectors are fetched in order and the psd-segment data is only
+        # requested for the detector without a PSD file
+        self.assertEqual(
+            get_data_method.call_args_list,
+            [
+                mock.call("H1", "GDS-CALIB_STRAIN", t0, t1),
+                mock.call("L1", "GDS-CALIB_STRAIN", t0_psd, t1_psd),
+                mock.call("L1", "GDS-CALIB_STRAIN", t0, t1),
+            ],
+        )
+        self.assertEqual(
+            [ifo.name for ifo in self.inputs.interferometers], ["H1", "L1"]
+        )
+        self.assertEqual(
+            self.inputs.interferometers[0].power_spectral_density.psd_file,
+            "tests/DATA/psd.txt",
+        )
+
+    @mock.patch(
+        "bilby_pipe.data_generation.DataGenerationInput.likelihood",
+        new_callable=mock.PropertyMock,
+    )
+    def test_save_data_dump_skips_non_roq_weights(self, likelihood_property):
+        likelihood_property.return_value = mock.Mock(weights=dict(a=1))
+        self.inputs.trigger_time = 0
+        self.inputs.distance_marginalization = False
+        self.inputs.likelihood_type = "MBGravitationalWaveTransient"
+        self.inputs.interferometers = bilby.gw.detector.InterferometerList(["H1"])
+        self.inputs.save_data_dump()
+        data_dump = DataDump.from_pickle(
+            DataDump.get_filename(self.inputs.data_directory, self.inputs.label)
+        )
+        self.assertIsNone(data_dump.likelihood_roq_weights)
+        self.assertIsNone(data_dump.likelihood_roq_params)
+
     @mock.patch("bilby_pipe.data_generation.DataGenerationInput._get_data")
     @mock.patch("bilby.gw.detector.inject_signal_into_gwpy_timeseries")
     def test_inject_signal_into_time_domain_data(
@@ -140,6 +140,24 @@ class TestGraceDB(unittest.TestCase):
     #         prior = gracedb.determine_prior_file_from_parameters(chirp_mass)
     #         self.assertTrue(prior in Input.get_default_prior_files())
 
+    def test_determine_duration_and_scale_factor_from_parameters(self):
+        expected = {
+            0.5: (128, 2.0),
+            0.9: (128, 2.0),
+            1.2: (128, 1.6),
+            2.0: (128, 1.0),
+            3.0: (64, 1.0),
+            13.53: (8, 1.0),
+            20: (4, 1.0),
+            50: (4, 0.5),
+            100: (4, 0.2),
+        }
+        for chirp_mass, (duration, scale_factor) in expected.items():
+            self.assertEqual(
+                gracedb.determine_duration_and_scale_factor_from_parameters(chirp_mass),
+                (duration, scale_factor),
+            )
+
     def test_parse_args(self):
         example_json_data = f"examples/gracedb/{self.example_gracedb_uid}.json"
         parser = gracedb.create_parser()
@@ -30,6 +30,14 @@ class TestInput(unittest.TestCase):
         out = inputs._split_string_by_space("H1 L1")
         self.assertEqual(out, ["H1", "L1"])
 
+    def test_sampler_kwargs_preset_not_shared(self):
+        inputs = bilby_pipe.main.Input()
+        inputs.sampler = "dynesty"
+        inputs.request_cpus = 4
+        inputs.sampler_kwargs = "Default"
+        self.assertEqual(inputs.sampler_kwargs["npool"], 4)
+        self.assertNotIn("npool", bilby_pipe.utils.SAMPLER_SETTINGS["Default"])
+
     def test_detectors(self):
         inputs = bilby_pipe.main.Input()
         with self.assertRaises(AttributeError):
@@ -388,6 +396,24 @@ class TestInput(unittest.TestCase):
             inputs.frequency_domain_source_model = "unknown"
             inputs.bilby_roq_frequency_domain_source_model
 
+    def test_bilby_multiband_frequency_domain_source_model(self):
+        inputs = bilby_pipe.main.Input()
+        inputs.frequency_domain_source_model = "lal_binary_black_hole"
+        self.assertEqual(
+            inputs.bilby_multiband_frequency_domain_source_model,
+            bilby.gw.source.binary_black_hole_frequency_sequence,
+        )
+
+        inputs.frequency_domain_source_model = "lal_binary_neutron_star"
+        self.assertEqual(
+            inputs.bilby_multiband_frequency_domain_source_model,
+            bilby.gw.source.binary_neutron_star_frequency_sequence,
+        )
+
+        with self.assertRaises(BilbyPipeError):
+            inputs.frequency_domain_source_model = "unknown"
+            inputs.bilby_multiband_frequency_domain_source_model
+
     def test_default_prior_files(self):
         inputs = bilby_pipe.main.Input()
         self.assertEqual(inputs.get_default_prior_files(), inputs.default_prior_files)
@@ -3,9 +3,12 @@ import os
 import shutil
 import unittest
 
+import mock
 import numpy as np
 
 import bilby_pipe
+from bilby_pipe.job_creation.dag import Dag
+from bilby_pipe.job_creation.node import Node
 from bilby_pipe.utils import BilbyPipeError
 
 
@@ -229,6 +232,22 @@ class TestMainInput(unittest.TestCase):
         )
         self.assertTrue(det_list, [["H1", "L1", "V1"], ["H1"], ["L1"], ["V1"]])
 
+    @mock.patch("shutil.which", return_value="/path/to/bilby_pipe_analysis")
+    def test_executable_path_cached_per_dag(self, which):
+        node = Node(self.inputs)
+        node.dag = Dag(self.inputs)
+        for _ in range(2):
+            self.assertEqual(
+                node._get_executable_path("bilby_pipe_analysis"),
+                "/path/to/bilby_pipe_analysis",
+            )
+        self.assertEqual(which.call_count, 1)
+
+        # A new DAG build resolves the executables again
+        node.dag = Dag(self.inputs)
+        node._get_executable_path("bilby_pipe_analysis")
+        self.assertEqual(which.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,10 @@ import os
 import shutil
 import unittest
 
+import mock
+
 import bilby_pipe
+from bilby_pipe.job_creation.slurm import SubmitSLURM
 
 
 class TestSlurm(unittest.TestCase):
@@ -32,6 +35,85 @@ class TestSlurm(unittest.TestCase):
         filename = os.path.join(self.outdir, "submit/slurm_label_master.sh")
         self.assertTrue(os.path.exists(filename))
 
+    def test_create_slurm_submit_sbatch_lines(self):
+        args_list = self.known_args_list + [
+            "--scheduler-args",
+            "account=myaccount partition=mypartition",
+        ]
+        inputs = bilby_pipe.main.MainInput(*self.parser.parse_known_args(args_list))
+        bilby_pipe.main.generate_dag(inputs)
+        filename = os.path.join(self.outdir, "submit/slurm_label_master.sh")
+        with open(filename, "r") as ff:
+            sbatch_lines = [line for line in ff if "sbatch" in line]
+
+        submit = f"{self.outdir}/submit"
+        generation = "label_data0_0-0_generation"
+        analysis = "label_data0_0-0_analysis_H1_dynesty"
+        pesummary = "label_pesummary"
+        slurm_args = "--account=myaccount --partition=mypartition --nodes=1"
+        expected = [
+            f"jid0=($(sbatch {slurm_args} --ntasks-per-node=1 --mem=8G "
+            f"--time=1:00:00 --job-name={generation} "
+            f"--output={self.outdir}/log_data_generation/{generation}.out "
+            f"--error={self.outdir}/log_data_generation/{generation}.err "
+            f"{submit}/{generation}.sh))\n",
+            f"jid1=($(sbatch {slurm_args} --ntasks-per-node=1 --mem=4G "
+            f"--time=7-00:00:00 --job-name={analysis} "
+            "--dependency=afterok:${jid0[-1]} "
+            f"--output={self.outdir}/log_data_analysis/{analysis}.out "
+            f"--error={self.outdir}/log_data_analysis/{analysis}.err "
+            f"{submit}/{analysis}.sh))\n",
+            f"jid2=($(sbatch {slurm_args} --ntasks-per-node=1 --mem=16G "
+            f"--time=1:00:00 --job-name={pesummary} "
+            "--dependency=afterok:${jid1[-1]} "
+            f"--output={self.outdir}/log_results_page/{pesummary}.out "
+            f"--error={self.outdir}/log_results_page/{pesummary}.err "
+            f"{submit}/{pesummary}.sh))\n",
+        ]
+        self.assertEqual(sbatch_lines, expected)
+
+    @mock.patch("bilby_pipe.job_creation.slurm.subprocess.run")
+    def test_create_slurm_submit_runs_sbatch(self, run):
+        args_list = self.known_args_list + ["--submit"]
+        inputs = bilby_pipe.main.MainInput(*self.parser.parse_known_args(args_list))
+        bilby_pipe.main.generate_dag(inputs)
+        run.assert_called_once_with(
+            ["sbatch", os.path.join(self.outdir, "submit/slurm_label_master.sh")]
+        )
+
+    @mock.patch("bilby_pipe.job_creation.slurm.subprocess.run")
+    def test_run_local_generation_splits_quoted_arguments(self, run):
+        generation_node = mock.Mock(
+            executable="/path/to/bilby_pipe_generation",
+            parents=[],
+            args=[
+                mock.Mock(
+                    arg="config.ini --label 'my label' "
+                    "--sampler-kwargs \"{'nlive': 1000}\""
+                )
+            ],
+        )
+        generation_node.name = "label_data0_0-0_generation"
+        analysis_node = mock.Mock(parents=[generation_node])
+        analysis_node.name = "label_data0_0-0_analysis_H1_dynesty"
+        dag = mock.Mock()
+        dag.pycondor_dag.nodes = [generation_node, analysis_node]
+
+        SubmitSLURM(dag).run_local_generation()
+
+        run.assert_called_once_with(
+            [
+                "/path/to/bilby_pipe_generation",
+                "config.ini",
+                "--label",
+                "my label",
+                "--sampler-kwargs",
+                "{'nlive': 1000}",
+            ]
+        )
+        self.assertEqual(dag.pycondor_dag.nodes, [analysis_node])
+        self.assertEqual(analysis_node.parents, [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -177,6 +177,9 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(
             ["H1", "L1"], bilby_pipe.utils.convert_detectors_input(["L1", "H1"])
         )
+        self.assertEqual(
+            ["H1", "L1"], bilby_pipe.utils.convert_detectors_input("l1 ,  H1,")
+        )
 
     def test_convert_prior_string_input_simpe(self):
         self.assertEqual(dict(a="1", b="2"), convert_prior_string_input("{a: 1, b:2}"))